@@ -1,10 +1,37 @@
+import functools
 import os
 import yaml
+try:
+    # LibYAML-backed loader is ~10x faster when PyYAML is built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from camel.agents import ChatAgent
 from camel.messages import BaseMessage
 from camel.models import ModelFactory
 from camel.types import ModelPlatformType, ModelType
 
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file; cached on (path, mtime) so unchanged files are free"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_config(path: str) -> dict:
+    """Load a YAML config file, re-parsing only when the file changes.
+
+    Args:
+        path (str): Path to the YAML config file.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    return _load_yaml_cached(path, mtime_ns)
+
+
 class GSAgent(ChatAgent):
     def __init__(self, name='GSAgent', llm_config=None, tools=None):
         """Initialize a GSAgent instance.
@@ -53,9 +80,7 @@ class GSAgent(ChatAgent):
 
 if __name__ == "__main__":
     # Load YAML configuration file
-    with open(os.path.join("config", "config.yml"), "r") as f:
-        config = yaml.safe_load(f)
-
+    config = load_config(os.path.join("config", "config.yml"))
 
     agent = GSAgent('GSAgent', config)
     
@@ -1,11 +1,19 @@
 import os
 import shutil
 import sqlite3
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 
 class ProjectManager:
+    # Default folder layout for a new project: (folder name, subfolders)
+    DEFAULT_LAYOUT = (
+        ("Literature Review", ("References",)),
+        ("Proposal", ()),
+        ("Experiment", ()),
+        ("Manuscript", ()),
+    )
+
     def __init__(self, base_path: Optional[str] = None):
         """Initialize the ProjectManager with a database and base path.
 
@@ -15,7 +23,7 @@ class ProjectManager:
         self.db_path = "research_projects.db"
         if base_path is None:
             # Default to user's Documents/Research Projects directory
-            self.base_path = os.path.join(Path.home(), "Documents", "Research Projects")
+            self.base_path = os.path.join(os.path.expanduser("~"), "Documents", "Research Projects")
         else:
             self.base_path = base_path
 
@@ -23,11 +31,59 @@ class ProjectManager:
         os.makedirs(self.base_path, exist_ok=True)
         self._create_database()
 
+        # One cached connection for all operations; opening a connection per
+        # call re-parses the schema and re-acquires the file lock every time.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # synchronous and temp_store are per-connection, unlike the
+        # persistent WAL mode
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        # Single worker for slow filesystem teardown so deletes don't block
+        # the caller (the Qt views call delete_project on the UI thread)
+        self._fs_executor = ThreadPoolExecutor(max_workers=1)
+
+        self._migrate_absolute_folder_paths()
+
+    def _migrate_absolute_folder_paths(self):
+        """Rewrite folder paths from older databases to project-relative form.
+
+        Earlier versions stored absolute folder paths; rename_project no
+        longer rewrites them, so left as-is they would strand at the old
+        directory after the first rename. One pass per project converts
+        them; on an already-relative database the UPDATEs match nothing.
+        """
+        with self._conn:
+            for row in self._conn.execute("SELECT id, path FROM projects").fetchall():
+                prefix = row["path"] + os.sep
+                self._conn.execute(
+                    "UPDATE folders SET path = substr(path, ?) WHERE project_id = ? AND substr(path, 1, ?) = ?",
+                    (len(prefix) + 1, row["id"], len(prefix), prefix)
+                )
+
+    def close(self):
+        """Flush pending filesystem work and close the database connection."""
+        self._fs_executor.shutdown(wait=True)
+        self._conn.close()
+
+    def __del__(self):
+        try:
+            self._fs_executor.shutdown(wait=False)
+            self._conn.close()
+        except Exception:
+            pass
+
     def _create_database(self):
         """Create the SQLite database and required tables."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # WAL + NORMAL sync cuts the fsync cost of every write transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
         # Create projects table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS projects (
@@ -38,19 +94,31 @@ class ProjectManager:
             )
         ''')
 
-        # Create folders table
+        # Create folders table. A plain INTEGER PRIMARY KEY aliases the
+        # rowid, so the table is already a clustered B-tree keyed by id and
+        # ids keep being auto-assigned (WITHOUT ROWID would forfeit that);
+        # dropping AUTOINCREMENT skips the sqlite_sequence bookkeeping, and
+        # the parent_id cascade deletes subtrees inside SQLite.
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS folders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER,
-                parent_id INTEGER,
+                id INTEGER PRIMARY KEY,
+                project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+                parent_id INTEGER REFERENCES folders (id) ON DELETE CASCADE,
                 name TEXT NOT NULL,
                 folder_type TEXT NOT NULL,
-                path TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
+                path TEXT NOT NULL
             )
         ''')
 
+        # Folder lookups filter on project_id/parent_id; without these the
+        # queries scan the whole folders table
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_folders_project_parent ON folders(project_id, parent_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent_id)"
+        )
+
         conn.commit()
         conn.close()
 
@@ -63,46 +131,72 @@ class ProjectManager:
         Returns:
             int: The ID of the created project.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create project directory
         project_path = os.path.join(self.base_path, project_name)
-        os.makedirs(project_path, exist_ok=True)
-
-        # Insert project into database
-        cursor.execute("INSERT INTO projects (name, path) VALUES (?, ?)", (project_name, project_path))
-        project_id = cursor.lastrowid
-
-        # Create default folders
-        default_folders = {
-            "Literature Review": ["References"],
-            "Proposal": [],
-            "Experiment": [],
-            "Manuscript": []
+
+        # Join every path exactly once; the same fragments were previously
+        # re-joined for directory creation and again for each insert batch
+        folder_paths = {
+            folder_name: os.path.join(project_path, folder_name)
+            for folder_name, _ in self.DEFAULT_LAYOUT
+        }
+        subfolder_paths = {
+            (folder_name, subfolder): os.path.join(folder_paths[folder_name], subfolder)
+            for folder_name, subfolders in self.DEFAULT_LAYOUT
+            for subfolder in subfolders
         }
 
-        for folder_name, subfolders in default_folders.items():
-            folder_path = os.path.join(project_path, folder_name)
-            os.makedirs(folder_path, exist_ok=True)
+        # Do all filesystem work up front: creating only the leaf paths
+        # covers the project directory and intermediate folders without a
+        # separate makedirs (and its stat storm) per level.
+        leaf_paths = [
+            folder_paths[folder_name]
+            for folder_name, subfolders in self.DEFAULT_LAYOUT
+            if not subfolders
+        ]
+        leaf_paths += list(subfolder_paths.values())
+        # The leaf paths are independent and makedirs releases the GIL in
+        # the syscall, so create them concurrently; with exist_ok=True the
+        # shared parents are safe to race on
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda path: os.makedirs(path, exist_ok=True), leaf_paths))
+
+        # Single transaction: one commit (and one fsync) for the whole batch
+        with self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute("INSERT INTO projects (name, path) VALUES (?, ?)", (project_name, project_path))
+            project_id = cursor.lastrowid
+
+            # Folder rows store project-relative paths; absolute paths are
+            # derived at read time, so renaming a project never has to
+            # rewrite them
+            folder_rows = [
+                (project_id, None, folder_name, 'default', folder_name)
+                for folder_name, _ in self.DEFAULT_LAYOUT
+            ]
+            cursor.executemany(
+                "INSERT INTO folders (project_id, parent_id, name, folder_type, path) VALUES (?, ?, ?, ?, ?)",
+                folder_rows
+            )
 
+            # Map generated folder ids back to their names for the subfolder rows
             cursor.execute(
-                "INSERT INTO folders (project_id, parent_id, name, folder_type, path) VALUES (?, NULL, ?, 'default', ?)",
-                (project_id, folder_name, folder_path)
+                "SELECT id, name FROM folders WHERE project_id=? AND parent_id IS NULL",
+                (project_id,)
             )
-            folder_id = cursor.lastrowid
-
-            # Create subfolders
-            for subfolder in subfolders:
-                subfolder_path = os.path.join(folder_path, subfolder)
-                os.makedirs(subfolder_path, exist_ok=True)
-                cursor.execute(
-                    "INSERT INTO folders (project_id, parent_id, name, folder_type, path) VALUES (?, ?, ?, 'default', ?)",
-                    (project_id, folder_id, subfolder, subfolder_path)
+            folder_ids = {row["name"]: row["id"] for row in cursor.fetchall()}
+
+            subfolder_rows = [
+                (project_id, folder_ids[folder_name], subfolder, 'default',
+                 os.path.join(folder_name, subfolder))
+                for folder_name, subfolder in subfolder_paths
+            ]
+
+            if subfolder_rows:
+                cursor.executemany(
+                    "INSERT INTO folders (project_id, parent_id, name, folder_type, path) VALUES (?, ?, ?, ?, ?)",
+                    subfolder_rows
                 )
 
-        conn.commit()
-        conn.close()
         return project_id
 
     def rename_project(self, project_id: int, new_name: str):
@@ -112,12 +206,9 @@ class ProjectManager:
             project_id (int): ID of the project to rename.
             new_name (str): New name for the project.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Get old project info
-        cursor.execute("SELECT name, path FROM projects WHERE id=?", (project_id,))
-        old_name, old_path = cursor.fetchone()
+        row = self._conn.execute("SELECT name, path FROM projects WHERE id=?", (project_id,)).fetchone()
+        old_path = row["path"]
 
         # Calculate new path
         new_path = os.path.join(os.path.dirname(old_path), new_name)
@@ -126,18 +217,10 @@ class ProjectManager:
         if os.path.exists(old_path):
             os.rename(old_path, new_path)
 
-        # Update database
-        cursor.execute("UPDATE projects SET name=?, path=? WHERE id=?", (new_name, new_path, project_id))
-
-        # Update paths in folders table
-        cursor.execute("SELECT id, path FROM folders WHERE project_id=?", (project_id,))
-        folders = cursor.fetchall()
-        for folder_id, folder_path in folders:
-            new_folder_path = folder_path.replace(old_path, new_path)
-            cursor.execute("UPDATE folders SET path=? WHERE id=?", (new_folder_path, folder_id))
-
-        conn.commit()
-        conn.close()
+        with self._conn:
+            # Folder paths are stored relative to the project root, so only
+            # the project row changes; the folder rows are untouched
+            self._conn.execute("UPDATE projects SET name=?, path=? WHERE id=?", (new_name, new_path, project_id))
 
     def delete_project(self, project_id: int):
         """Delete a project and its associated files.
@@ -145,22 +228,19 @@ class ProjectManager:
         Args:
             project_id (int): ID of the project to delete.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         # Get project path
-        cursor.execute("SELECT path FROM projects WHERE id=?", (project_id,))
-        project_path = cursor.fetchone()[0]
+        project_path = self._conn.execute(
+            "SELECT path FROM projects WHERE id=?", (project_id,)
+        ).fetchone()["path"]
 
-        # Delete project directory
+        # Delete the directory tree in the background; rmtree walks the tree
+        # one stat at a time and would stall the caller for large projects
         if os.path.exists(project_path):
-            shutil.rmtree(project_path)
+            self._fs_executor.submit(shutil.rmtree, project_path, ignore_errors=True)
 
         # Delete from database (folders will be deleted due to CASCADE)
-        cursor.execute("DELETE FROM projects WHERE id=?", (project_id,))
-
-        conn.commit()
-        conn.close()
+        with self._conn:
+            self._conn.execute("DELETE FROM projects WHERE id=?", (project_id,))
 
     def list_projects(self) -> List[Dict[str, str]]:
         """List all projects.
@@ -168,14 +248,8 @@ class ProjectManager:
         Returns:
             List[Dict[str, str]]: A list of projects with their ID, name, and path.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT id, name, path FROM projects")
-        projects = [{"id": row[0], "name": row[1], "path": row[2]} for row in cursor.fetchall()]
-
-        conn.close()
-        return projects
+        cursor = self._conn.execute("SELECT id, name, path FROM projects")
+        return [{"id": row["id"], "name": row["name"], "path": row["path"]} for row in cursor.fetchall()]
 
     def get_project(self, project_id: int) -> Optional[Dict[str, str]]:
         """Get details of a specific project.
@@ -186,15 +260,9 @@ class ProjectManager:
         Returns:
             Optional[Dict[str, str]]: Project details or None if not found.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT id, name, path FROM projects WHERE id=?", (project_id,))
-        row = cursor.fetchone()
-
-        conn.close()
+        row = self._conn.execute("SELECT id, name, path FROM projects WHERE id=?", (project_id,)).fetchone()
         if row:
-            return {"id": row[0], "name": row[1], "path": row[2]}
+            return {"id": row["id"], "name": row["name"], "path": row["path"]}
         return None
 
     def get_project_structure(self, project_id: int) -> List[Dict]:
@@ -206,26 +274,48 @@ class ProjectManager:
         Returns:
             List[Dict]: List of folders with their properties and relationships.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, parent_id, name, folder_type, path 
-            FROM folders 
-            WHERE project_id=? 
-            ORDER BY parent_id NULLS FIRST, name
+        cursor = self._conn.execute("""
+            SELECT f.id, f.parent_id, f.name, f.folder_type, f.path,
+                   p.path AS project_path
+            FROM folders f JOIN projects p ON p.id = f.project_id
+            WHERE f.project_id=?
+            ORDER BY f.parent_id NULLS FIRST, f.name
         """, (project_id,))
-        
-        folders = [
+
+        # Stored paths are project-relative; absolute rows from older
+        # databases are converted once at startup
+        return [
             {
-                "id": row[0],
-                "parent_id": row[1],
-                "name": row[2],
-                "folder_type": row[3],
-                "path": row[4]
+                "id": row["id"],
+                "parent_id": row["parent_id"],
+                "name": row["name"],
+                "folder_type": row["folder_type"],
+                "path": os.path.join(row["project_path"], row["path"])
             }
             for row in cursor.fetchall()
         ]
 
-        conn.close()
-        return folders
\ No newline at end of file
+    def get_all_project_structures(self) -> Dict[int, List[Dict]]:
+        """Get the folder structures of every project in a single query.
+
+        Returns:
+            Dict[int, List[Dict]]: Folder lists keyed by project ID, each in
+            the same shape as get_project_structure.
+        """
+        cursor = self._conn.execute("""
+            SELECT f.id, f.project_id, f.parent_id, f.name, f.folder_type, f.path,
+                   p.path AS project_path
+            FROM folders f JOIN projects p ON p.id = f.project_id
+            ORDER BY f.project_id, f.parent_id NULLS FIRST, f.name
+        """)
+
+        structures: Dict[int, List[Dict]] = {}
+        for row in cursor.fetchall():
+            structures.setdefault(row["project_id"], []).append({
+                "id": row["id"],
+                "parent_id": row["parent_id"],
+                "name": row["name"],
+                "folder_type": row["folder_type"],
+                "path": os.path.join(row["project_path"], row["path"])
+            })
+        return structures
@@ -1,16 +1,24 @@
 """
 Enhanced Google Scholar scraper with proxy support and robust error handling
 """
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import csv
+import re
+import threading
 import time
 import random
 from typing import Optional, List, Dict, Tuple, Any
 from dataclasses import dataclass
 import logging
-from pathlib import Path
-import html5lib
 from datetime import datetime
 from fake_useragent import UserAgent
 
@@ -24,6 +32,28 @@ logging.basicConfig(
     ]
 )
 
+# Compiled once; per-call re.search(str_pattern, ...) pays a cache lookup
+# and pattern check on every result row
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_CITES_RE = re.compile(r'Cited by (\d+)')
+
+# Shared pool of user-agent strings, sampled once on first use;
+# fake_useragent's .random re-picks (and in some versions re-parses its
+# data file) on every access, and each UserAgent() instance repeats setup
+_UA_POOL: Optional[tuple] = None
+
+# Column order for batch CSV saves
+_CSV_FIELDS = ['title', 'url', 'authors', 'year', 'citations', 'abstract']
+
+
+def _random_ua() -> str:
+    """Return a random user-agent string from the shared pool"""
+    global _UA_POOL
+    if _UA_POOL is None:
+        ua = UserAgent()
+        _UA_POOL = tuple(ua.random for _ in range(32))
+    return random.choice(_UA_POOL)
+
 @dataclass
 class ProxyConfig:
     """Proxy configuration settings"""
@@ -48,86 +78,131 @@ class ScraperConfig:
     timeout: int = 30
     batch_size: int = 10
     save_batch: bool = True
+    backoff_base: float = 2.0
+    backoff_cap: float = 120.0
 
 class ProxyManager:
     """Manages proxy rotation and validation"""
     
     def __init__(self, config: ProxyConfig):
         self.config = config
-        self.proxies: List[Dict[str, str]] = []
+        # Pool entries are hashable (http_url, https_url) tuples; dicts per
+        # proxy would defeat set-based dedup and cost O(N) list removal
+        self.proxies: List[Tuple[str, str]] = []
         self.current_proxy: Optional[Dict[str, str]] = None
-        self.ua = UserAgent()
+        # Keep-alive pooled session so proxy-list fetches and validation
+        # probes reuse connections instead of a fresh TCP+TLS setup per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
-    def _fetch_proxies_from_sslproxies(self) -> List[Dict[str, str]]:
+    def _fetch_proxies_from_sslproxies(self) -> List[Tuple[str, str]]:
         """Fetch proxies from sslproxies.org"""
         try:
-            response = requests.get('https://www.sslproxies.org')
-            soup = BeautifulSoup(response.content, 'html5lib')
-            
+            response = self.session.get('https://www.sslproxies.org')
+            # lxml is the C-backed parser; from_encoding skips chardet sniffing
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8')
+
+            # One traversal; the old code re-ran find_all('td') per row,
+            # making the scrape quadratic in the table size
+            tds = soup.find_all('td')
             proxies = []
-            for i in range(0, len(soup.find_all('td')[::8])):
-                ip = soup.find_all('td')[::8][i].text
-                port = soup.find_all('td')[1::8][i].text
-                proxy = f'{ip}:{port}'
-                proxies.append({'https': f'https://{proxy}', 'http': f'http://{proxy}'})
-            
+            for i in range(0, len(tds) - 1, 8):
+                proxy = f'{tds[i].text}:{tds[i + 1].text}'
+                proxies.append((f'http://{proxy}', f'https://{proxy}'))
+
             return proxies
         except Exception as e:
             logging.error(f"Error fetching proxies from sslproxies.org: {e}")
             return []
 
-    def _fetch_proxies_from_github(self, url: str) -> List[Dict[str, str]]:
+    def _fetch_proxies_from_github(self, url: str) -> List[Tuple[str, str]]:
         """Fetch proxies from GitHub proxy lists"""
         try:
-            response = requests.get(url)
-            proxies = []
-            for line in response.text.split('\n'):
-                if line.strip():
-                    proxy = line.strip()
-                    proxies.append({
-                        'https': f'https://{proxy}',
-                        'http': f'http://{proxy}'
-                    })
-            return proxies
+            # Stream the list instead of materializing the whole body as one
+            # string and then a second list of lines; strip each line once
+            response = self.session.get(url, stream=True)
+            return [
+                (f'http://{proxy}', f'https://{proxy}')
+                for line in response.iter_lines(decode_unicode=True)
+                if (proxy := line.strip())
+            ]
         except Exception as e:
             logging.error(f"Error fetching proxies from {url}: {e}")
             return []
 
     def refresh_proxies(self):
-        """Refresh the proxy pool"""
-        self.proxies = []
-        
+        """Refresh the proxy pool, validating all candidates concurrently"""
+        candidates = []
+
         # Fetch from all sources
         for source in self.config.proxy_sources:
             if 'sslproxies.org' in source:
-                self.proxies.extend(self._fetch_proxies_from_sslproxies())
+                candidates.extend(self._fetch_proxies_from_sslproxies())
             else:
-                self.proxies.extend(self._fetch_proxies_from_github(source))
-                
-        logging.info(f"Refreshed proxy pool. Total proxies: {len(self.proxies)}")
+                candidates.extend(self._fetch_proxies_from_github(source))
+
+        # Tuples are hashable, so duplicates across sources dedup for free
+        candidates = list(set(candidates))
+
+        # Validating one proxy at a time serializes hundreds of network
+        # timeouts; probing them all in parallel finishes in ~one timeout
+        self.proxies = asyncio.run(self._avalidate_proxies(candidates))
+
+        logging.info(
+            f"Refreshed proxy pool. Working proxies: {len(self.proxies)} of {len(candidates)}"
+        )
+
+    async def _avalidate_proxies(self, candidates: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Probe all candidate proxies concurrently, keeping the working ones"""
+        if not candidates:
+            return []
+
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *[self._atest_proxy(session, proxy) for proxy in candidates]
+            )
+
+        return [proxy for proxy, ok in zip(candidates, results) if ok]
+
+    async def _atest_proxy(self, session: aiohttp.ClientSession, proxy: Tuple[str, str]) -> bool:
+        """Async counterpart of _test_proxy"""
+        try:
+            async with session.get(
+                'https://scholar.google.com',
+                proxy=proxy[0],
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers={'User-Agent': _random_ua()}
+            ) as response:
+                return response.status == 200
+        except Exception:
+            return False
 
     def get_proxy(self) -> Dict[str, str]:
         """Get a working proxy"""
         if not self.proxies:
             self.refresh_proxies()
-            
-        while self.proxies:
-            proxy = random.choice(self.proxies)
-            if self._test_proxy(proxy):
-                self.current_proxy = proxy
-                return proxy
-            self.proxies.remove(proxy)
-            
+
+        # The pool only holds proxies that passed validation on refresh, so
+        # no per-call probe is needed; dead ones get weeded out next refresh
+        if self.proxies:
+            http_url, https_url = random.choice(self.proxies)
+            # Build the requests-style dict only at the hand-off point
+            self.current_proxy = {'http': http_url, 'https': https_url}
+            return self.current_proxy
+
         raise Exception("No working proxies available")
 
     def _test_proxy(self, proxy: Dict[str, str]) -> bool:
         """Test if a proxy is working"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://scholar.google.com',
                 proxies=proxy,
                 timeout=self.config.timeout,
-                headers={'User-Agent': self.ua.random}
+                headers={'User-Agent': _random_ua()}
             )
             return response.status_code == 200
         except:
@@ -136,84 +211,189 @@ class ProxyManager:
 class ScholarScraper:
     """Enhanced Google Scholar scraper with proxy support"""
     
+    # Keep this many proxy sessions (and their keep-alive sockets) around
+    _MAX_SESSIONS = 16
+
     def __init__(self, proxy_config: ProxyConfig, scraper_config: ScraperConfig):
         self.proxy_manager = ProxyManager(proxy_config)
         self.config = scraper_config
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        
+        # One Session per proxy, LRU-evicted: a shared session's pool is
+        # keyed per proxy anyway, but rotating through hundreds of proxies
+        # would pin a socket pool open for each one ever used. The parallel
+        # page fetchers share this map, so access goes through a lock, and
+        # sessions still checked out when evicted are retired instead of
+        # closed out from under a request in flight.
+        self._sessions: "OrderedDict[Optional[str], requests.Session]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self._session_refs: Dict[requests.Session, int] = {}
+        self._retired_sessions: List[requests.Session] = []
+        # Batch CSV output: one file per run, named at construction time and
+        # opened lazily on first save
+        self._csv_path = f"scholar_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self._csv_fh = None
+        self._csv_writer = None
+
+    def _session_for(self, proxy: Optional[Dict[str, str]]) -> requests.Session:
+        """Check out the pooled session for a proxy, LRU-ordered.
+
+        Pair every call with _release_session once the request is done.
+        """
+        key = proxy['http'] if proxy else None
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            else:
+                session = requests.Session()
+                if proxy:
+                    session.proxies.update(proxy)
+                self._sessions[key] = session
+                if len(self._sessions) > self._MAX_SESSIONS:
+                    _, evicted = self._sessions.popitem(last=False)
+                    if self._session_refs.get(evicted, 0) == 0:
+                        evicted.close()
+                    else:
+                        # Still serving another worker; closed on release
+                        self._retired_sessions.append(evicted)
+            self._session_refs[session] = self._session_refs.get(session, 0) + 1
+            return session
+
+    def _release_session(self, session: requests.Session):
+        """Return a checked-out session; close it if it was retired."""
+        with self._sessions_lock:
+            remaining = self._session_refs.get(session, 1) - 1
+            if remaining > 0:
+                self._session_refs[session] = remaining
+                return
+            self._session_refs.pop(session, None)
+            if session in self._retired_sessions:
+                self._retired_sessions.remove(session)
+                session.close()
+
+    def close(self):
+        """Close the batch CSV file and any open proxy sessions"""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+        with self._sessions_lock:
+            while self._sessions:
+                _, session = self._sessions.popitem(last=False)
+                session.close()
+            for session in self._retired_sessions:
+                session.close()
+            self._retired_sessions.clear()
+            self._session_refs.clear()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get random headers"""
         return {
-            'User-Agent': self.ua.random,
+            'User-Agent': _random_ua(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
         }
 
-    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    def _backoff_delay(self, attempt: int, response=None) -> float:
+        """Delay before the next attempt: honor Retry-After when the server
+        sent one, otherwise exponential backoff with jitter"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    # HTTP-date form
+                    try:
+                        when = parsedate_to_datetime(retry_after)
+                        return max(0.0, (when - datetime.now(when.tzinfo)).total_seconds())
+                    except (TypeError, ValueError):
+                        pass
+        # Jitter keeps parallel workers from retrying in lockstep
+        return (min(self.config.backoff_cap, self.config.backoff_base * 2 ** attempt)
+                + random.uniform(0, self.config.backoff_base))
+
+    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
         """Make a request with retry and proxy rotation"""
         for attempt in range(self.config.max_retries):
             try:
                 proxy = self.proxy_manager.get_proxy() if self.proxy_manager.config.use_proxy else None
-                
-                response = self.session.get(
-                    url,
-                    params=params,
-                    headers=self._get_headers(),
-                    proxies=proxy,
-                    timeout=self.config.timeout
-                )
-                
+
+                session = self._session_for(proxy)
+                try:
+                    response = session.get(
+                        url,
+                        params=params,
+                        headers=self._get_headers(),
+                        timeout=self.config.timeout
+                    )
+                finally:
+                    self._release_session(session)
+
                 if response.status_code == 200:
-                    return response.text
+                    # Hand the raw bytes to the parser; response.text would
+                    # hold a second, decoded copy of the page in memory
+                    return response.content
                 elif response.status_code == 429:
-                    logging.warning(f"Rate limited. Waiting {(attempt + 1) * 10} seconds...")
-                    time.sleep((attempt + 1) * 10)
+                    # Rate limit, not a dead proxy: back off but keep the pool
+                    delay = self._backoff_delay(attempt, response)
+                    logging.warning(f"Rate limited. Waiting {delay:.1f} seconds...")
+                    time.sleep(delay)
                 else:
                     logging.warning(f"Request failed with status code: {response.status_code}")
-                    
+                    time.sleep(self._backoff_delay(attempt))
+
             except Exception as e:
                 logging.error(f"Request failed: {e}")
                 self.proxy_manager.refresh_proxies()
-                
-            # Random delay between attempts
-            time.sleep(random.uniform(*self.config.delay_range))
-            
+                time.sleep(self._backoff_delay(attempt))
+
         return None
 
-    def _parse_paper_details(self, result_div: BeautifulSoup) -> Dict[str, Any]:
-        """Parse paper details from a result div"""
+    def _parse_paper_details(self, result_div) -> Dict[str, Any]:
+        """Parse paper details from a result node"""
         try:
-            # Extract title and link
-            title_elem = result_div.select_one(".gs_rt a")
-            title = title_elem.text if title_elem else "No title"
-            url = title_elem['href'] if title_elem else None
-            
-            # Extract author information
-            author_elem = result_div.select_one(".gs_a")
-            author_text = author_elem.text if author_elem else ""
-            
-            # Extract year
+            # One walk over the result subtree instead of four css_first
+            # calls, each of which re-traverses the node from the top
+            title_elem = author_elem = citations_elem = abstract_elem = None
+            remaining = 4
+            for node in result_div.traverse(include_text=False):
+                classes = node.attributes.get('class')
+                if not classes:
+                    continue
+                if title_elem is None and 'gs_rt' in classes:
+                    title_elem = node.css_first('a')
+                elif author_elem is None and 'gs_a' in classes:
+                    author_elem = node
+                elif citations_elem is None and 'gs_fl' in classes:
+                    citations_elem = node
+                elif abstract_elem is None and 'gs_rs' in classes:
+                    abstract_elem = node
+                else:
+                    continue
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            title = title_elem.text() if title_elem else "No title"
+            url = title_elem.attributes.get('href') if title_elem else None
+
+            author_text = author_elem.text() if author_elem else ""
+
             year = None
             if author_text:
-                year_match = re.search(r'\b(19|20)\d{2}\b', author_text)
+                year_match = _YEAR_RE.search(author_text)
                 if year_match:
                     year = int(year_match.group(0))
-            
-            # Extract citations
-            citations_elem = result_div.select_one(".gs_fl")
+
             citations = 0
             if citations_elem:
-                citations_text = citations_elem.text
-                citations_match = re.search(r'Cited by (\d+)', citations_text)
+                citations_match = _CITES_RE.search(citations_elem.text())
                 if citations_match:
                     citations = int(citations_match.group(1))
-            
-            # Extract abstract
-            abstract_elem = result_div.select_one(".gs_rs")
-            abstract = abstract_elem.text if abstract_elem else "No abstract"
-            
+
+            abstract = abstract_elem.text() if abstract_elem else "No abstract"
+
             return {
                 'title': title,
                 'url': url,
@@ -226,70 +406,80 @@ class ScholarScraper:
             logging.error(f"Error parsing paper details: {e}")
             return None
 
-    def search(self, query: str, max_results: int = 100) -> List[Dict[str, Any]]:
-        """Search Google Scholar and return results"""
+    def search(self, query: str, max_results: int = 100,
+               concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Search Google Scholar and return results.
+
+        Page offsets are known up front, so pages are fetched concurrently
+        (each worker rotates to its own proxy via _make_request) instead of
+        serially waiting out RTT plus a politeness delay per page.
+        """
+        offsets = list(range(0, max_results, self.config.batch_size))
+
         results = []
-        start = 0
-        
-        while start < max_results:
-            logging.info(f"Fetching results {start + 1} to {start + self.config.batch_size}")
-            
-            html = self._make_request(
-                'https://scholar.google.com/scholar',
-                params={
-                    'q': query,
-                    'start': start,
-                    'hl': 'en',
-                    'as_sdt': '0,5'
-                }
-            )
-            
-            if not html:
-                break
-                
-            soup = BeautifulSoup(html, 'html.parser')
-            result_divs = soup.select(".gs_r.gs_or.gs_scl")
-            
-            if not result_divs:
-                break
-                
-            batch_results = []
-            for div in result_divs:
-                paper_details = self._parse_paper_details(div)
-                if paper_details:
-                    batch_results.append(paper_details)
-                    
-            results.extend(batch_results)
-            
-            # Save batch if enabled
-            if self.config.save_batch and batch_results:
-                self._save_batch(batch_results)
-                
-            # Break if we got fewer results than batch size
-            if len(batch_results) < self.config.batch_size:
-                break
-                
-            start += self.config.batch_size
-            time.sleep(random.uniform(*self.config.delay_range))
-            
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for batch_results in executor.map(
+                lambda start: self._fetch_page(query, start), offsets
+            ):
+                results.extend(batch_results)
+
+                # Save batch if enabled (serialized here on the main thread;
+                # the CSV writer is not thread-safe)
+                if self.config.save_batch and batch_results:
+                    self._save_batch(batch_results)
+
         return results[:max_results]
 
+    def _fetch_page(self, query: str, start: int) -> List[Dict[str, Any]]:
+        """Fetch and parse a single results page"""
+        # Jittered stagger so concurrent workers don't fire in lockstep
+        time.sleep(random.uniform(0, self.config.delay_range[1]))
+
+        logging.info(f"Fetching results {start + 1} to {start + self.config.batch_size}")
+
+        html = self._make_request(
+            'https://scholar.google.com/scholar',
+            params={
+                'q': query,
+                'start': start,
+                'hl': 'en',
+                'as_sdt': '0,5'
+            }
+        )
+
+        if not html:
+            return []
+
+        # Lexbor builds no Python object per node, unlike BeautifulSoup, and
+        # decodes the bytes itself so only one copy of the page is alive
+        tree = LexborHTMLParser(html)
+        del html
+
+        batch_results = []
+        for div in tree.css("div.gs_r.gs_or.gs_scl"):
+            paper_details = self._parse_paper_details(div)
+            if paper_details:
+                batch_results.append(paper_details)
+
+        return batch_results
+
     def _save_batch(self, batch: List[Dict[str, Any]]):
-        """Save a batch of results to CSV"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = Path(f'scholar_results_{timestamp}.csv')
-        
-        # Create file with headers if it doesn't exist
-        if not filepath.exists():
-            fieldnames = ['title', 'url', 'authors', 'year', 'citations', 'abstract']
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-        
-        # Append batch results
-        with open(filepath, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writerows(batch)
+        """Append a batch of results to this run's CSV file.
+
+        The file handle and DictWriter are created once and reused; the old
+        per-batch open/close also stamped a new filename each time, scattering
+        one run's results across many files.
+        """
+        if self._csv_writer is None:
+            self._csv_fh = open(
+                self._csv_path,
+                'w', newline='', buffering=1 << 16, encoding='utf-8'
+            )
+            self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=_CSV_FIELDS)
+            self._csv_writer.writeheader()
+
+        self._csv_writer.writerows(batch)
+        self._csv_fh.flush()
 
 def main():
     # Configuration
@@ -6,5 +6,5 @@ setup(
     description='Automated research assistant system',
     author='Your Name',
     packages=find_packages(include=['gscientist', 'gscientist.*']),  # Only include the gscientist package
-    python_requires='>=3.8',  # Specify the minimum Python version
+    python_requires='>=3.10',  # Specify the minimum Python version
 )
\ No newline at end of file
@@ -1,30 +1,96 @@
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QFrame, 
                             QLabel, QTextBrowser, QSizePolicy, QApplication)
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtGui import QPixmap
+import functools
 import re
 import os
 import sys
+from collections import OrderedDict
 from chat_ui import Ui_Form
-import yaml
 from camel.messages import BaseMessage
 
 
-from gscientist.agents.gs_agent import GSAgent
+from gscientist.agents.gs_agent import GSAgent, load_config
 from gscientist.tools.builtins.paper_search.arxiv import ArxivSearcher
 
+# Anchored to this file, not the CWD, and loaded through the mtime-keyed
+# cache shared with GSAgent so every widget sees the same parsed dict
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "config", "config.yml")
 
+# Same anchoring for images: a CWD-relative "resources" only resolved when
+# the app was launched from this directory
+_RESOURCES_DIR = os.path.join(os.path.dirname(__file__), "resources")
 
-class AIThread(QThread):
-    """Thread for handling AI responses"""
-    reply_ready = Signal(str)  # Signal for sending AI responses
+# Prefer images bundled into the binary when the compiled resource module
+# (pyside6-rcc resources.qrc -o resources_rc.py) is available; loading from
+# the resource system skips per-image disk I/O at runtime
+try:
+    import resources_rc  # noqa: F401
+    _HAVE_QRC = True
+except ImportError:
+    _HAVE_QRC = False
+
+# All message formatting in one alternation, compiled once at import.
+# Earlier branches win, so code fences swallow their contents before the
+# url/bold/italic branches can see them, and the lookarounds keep lone
+# asterisks from pairing with half of a bold marker.
+_FMT_RE = re.compile(
+    r"```(?P<code>[\s\S]*?)```"
+    r"|(?P<url>https?://\S+)"
+    r"|\*\*(?P<bold>.*?)\*\*"
+    r"|(?<!\*)\*(?P<italic>[^*]+)\*(?!\*)"
+    r"|(?P<nl>\n)"
+)
+
+# Code-block template, built once; per-message work is two concatenations
+_CODE_PRE = (
+    "<pre style='"
+    "background-color: #1e1e1e;"
+    " color: #d4d4d4;"
+    " padding: 10px;"
+    " border-radius: 5px;"
+    ' font-family: "Courier New", monospace;'
+    " white-space: pre-wrap;"
+    " margin: 5px 0;"
+    "'>"
+)
+_CODE_POST = "</pre>"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_avatar(filename):
+    """Load an avatar image pre-scaled to its display size, cached per file."""
+    if _HAVE_QRC:
+        avatar_path = f":/resources/{filename}"
+    else:
+        avatar_path = os.path.join(_RESOURCES_DIR, filename)
+    pixmap = QPixmap(avatar_path)
+    if pixmap.isNull():
+        print(f"Warning: Could not load avatar image from {avatar_path}")
+        return pixmap
+    return pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+
+class AIJobSignals(QObject):
+    """Signals for AIJob; QRunnable cannot carry signals itself"""
+    chunk_ready = Signal(str)  # Signal for partial response text
+    reply_ready = Signal(str)  # Signal for the complete AI response
     error_occurred = Signal(str)  # Signal for sending error messages
+    finished = Signal()
+
+
+class AIJob(QRunnable):
+    """Pooled job for handling AI responses"""
 
     def __init__(self, agent, message):
         super().__init__()
         self.agent = agent
         self.message = message
+        self.signals = AIJobSignals()
 
+    @Slot()
     def run(self):
         try:
             # Create proper message format for GSAgent
@@ -32,27 +98,63 @@ class AIThread(QThread):
                 role_name="User",
                 content=self.message
             )
-            
+
             # Get response from agent
             response = self.agent.step(user_msg)
             if response and response.msgs:
-                self.reply_ready.emit(response.msgs[0].content)
+                content = response.msgs[0].content
+                if isinstance(content, str):
+                    # Synchronous step: the whole reply arrives at once, so
+                    # it travels the chunk path as a single piece
+                    self.signals.chunk_ready.emit(content)
+                    self.signals.reply_ready.emit(content)
+                else:
+                    # Streaming model config: content is an iterable of
+                    # partial pieces; forward each as it lands
+                    parts = []
+                    for piece in content:
+                        text = getattr(piece, "content", piece)
+                        parts.append(text)
+                        self.signals.chunk_ready.emit(text)
+                    self.signals.reply_ready.emit(''.join(parts))
             else:
-                self.error_occurred.emit("No valid response received, please try again.")
+                self.signals.error_occurred.emit("No valid response received, please try again.")
         except Exception as e:
             print(f"Error generating reply: {str(e)}")
-            self.error_occurred.emit(f"Sorry, something went wrong: {str(e)}")
+            self.signals.error_occurred.emit(f"Sorry, something went wrong: {str(e)}")
+        finally:
+            self.signals.finished.emit()
 
 class ChatWidget(QWidget):
+    # The styles only vary by sender, so build all four sheets once instead
+    # of re-interpolating an f-string for every message
+    _USER_BUBBLE_QSS = "QFrame { background-color: #007AFF; border-radius: 15px; }"
+    _AI_BUBBLE_QSS = "QFrame { background-color: #E9E9EB; border-radius: 15px; }"
+    _USER_MESSAGE_QSS = "QTextBrowser { background: transparent; border: none; color: white; }"
+    _AI_MESSAGE_QSS = "QTextBrowser { background: transparent; border: none; color: black; }"
+
+    # Horizontal space taken by the avatar, bubble margins and layout
+    # spacing around the text browser inside a message row
+    _MESSAGE_CHROME_WIDTH = 110
+
+    # Oldest bubbles beyond this are torn down; their text stays in
+    # _history, so the widget tree stops growing with the conversation
+    _MAX_LIVE_MESSAGES = 200
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui = Ui_Form()
         self.ui.setupUi(self)
-        
+
+        # Top-align the message column instead of keeping an expanding
+        # spacer as the last layout item; plain addWidget then appends in
+        # O(1) with no index bookkeeping. Done here at runtime so the
+        # generated chat_ui.py stays untouched.
+        self.ui.messageLayout.removeItem(self.ui.verticalSpacer)
+        self.ui.messageLayout.setAlignment(Qt.AlignTop)
+
         # Initialize AutoGen agent
-        config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config", "config.yml")
-        with open(config_path, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = load_config(CONFIG_PATH)
         # Verity if the config file is loaded correctly
         if config is None:
             raise ValueError("Failed to load configuration file.")
@@ -65,55 +167,87 @@ class ChatWidget(QWidget):
         
         # Connect signals
         self.ui.sendButton.clicked.connect(self.on_send_clicked)
-        self.ui.messageInput.textChanged.connect(self.adjust_input_height)
-        
-        # Initialize AI thread
-        self.ai_thread = None
-        
+        # Debounce input resizing to one shot per frame: textChanged fires on
+        # every keystroke and paste chunk, and resizing mid-burst relayouts
+        # the whole form each time
+        self._input_resize_timer = QTimer(self)
+        self._input_resize_timer.setSingleShot(True)
+        self._input_resize_timer.setInterval(16)
+        self._input_resize_timer.timeout.connect(self.adjust_input_height)
+        self.ui.messageInput.textChanged.connect(self._input_resize_timer.start)
+
+        # Follow the bottom when the transcript grows: reacting to
+        # rangeChanged scrolls after layout has actually happened, instead of
+        # jumping to the stale pre-insert maximum on every add_message. Only
+        # sticks while the user is already at (or near) the bottom, so
+        # scrolling up to read history survives streaming resizes.
+        self._stick_to_bottom = True
+        scrollbar = self.ui.scrollArea.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._track_scroll_position)
+        scrollbar.rangeChanged.connect(self._follow_transcript_growth)
+
+        # Shared worker pool: reuses threads across messages instead of
+        # paying QThread start-up and teardown per send
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+        # Replies keyed by the exact message text; re-asking the same
+        # question answers instantly instead of re-running the agent
+        self._reply_cache = OrderedDict()
+        self._reply_cache_size = 64
+
+        # In-progress streamed reply: accumulated pieces and the bubble
+        # browser being updated in place
+        self._stream_parts = []
+        self._stream_browser = None
+
+        # Full transcript as plain (text, is_user) records, independent of
+        # which bubbles are still materialized as widgets
+        self._history = []
+
+        # Load and scale the two avatars once; add_message reuses them
+        self._user_avatar = _load_avatar("user_avatar.png")
+        self._ai_avatar = _load_avatar("ai_avatar.png")
+
+    def _track_scroll_position(self, value):
+        """Remember whether the user is pinned to the bottom of the chat"""
+        scrollbar = self.ui.scrollArea.verticalScrollBar()
+        self._stick_to_bottom = value >= scrollbar.maximum() - 4
+
+    def _follow_transcript_growth(self, _min, _max):
+        """Keep the view at the bottom only if it was there before the change"""
+        if self._stick_to_bottom:
+            self.ui.scrollArea.verticalScrollBar().setValue(_max)
+
     def format_text(self, text, is_user=True):
         """Format text, handle code blocks, links, etc."""
-        formatted_text = text
-        
-        # Handle code blocks (content surrounded by ```)
-        code_pattern = r"```(.*?)```"
-        formatted_text = re.sub(code_pattern, self._format_code_block, formatted_text, flags=re.DOTALL)
-        
-        # Handle links
-        url_pattern = r'https?://\S+'
-        formatted_text = re.sub(url_pattern, 
-            lambda m: f'<a href="{m.group()}" style="color: {"white" if is_user else "blue"}">{m.group()}</a>', 
-            formatted_text)
-        
-        # Handle bold text **text**
-        bold_pattern = r'\*\*(.*?)\*\*'
-        formatted_text = re.sub(bold_pattern, r'<b>\1</b>', formatted_text)
-        
-        # Handle italic text *text*
-        italic_pattern = r'\*(.*?)\*'
-        formatted_text = re.sub(italic_pattern, r'<i>\1</i>', formatted_text)
-        
-        # Handle line breaks
-        formatted_text = formatted_text.replace('\n', '<br>')
-        
-        return formatted_text
-    
-    def _format_code_block(self, match):
-        """Format code blocks"""
-        code = match.group(1).strip()
-        return f"""
-            <pre style='
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                padding: 10px;
-                border-radius: 5px;
-                font-family: "Courier New", monospace;
-                white-space: pre-wrap;
-                margin: 5px 0;
-            '>{code}</pre>
-        """
+        # One pass over the message instead of five (four regex subs plus a
+        # str.replace), each of which rescanned and copied the whole string.
+        # A single pass also stops the later rules from reformatting text
+        # already inside a rendered code block.
+        color = "white" if is_user else "blue"
+
+        def _render(m):
+            code = m.group('code')
+            if code is not None:
+                return _CODE_PRE + code.strip() + _CODE_POST
+            url = m.group('url')
+            if url is not None:
+                return f'<a href="{url}" style="color: {color}">{url}</a>'
+            bold = m.group('bold')
+            if bold is not None:
+                return f'<b>{bold}</b>'
+            italic = m.group('italic')
+            if italic is not None:
+                return f'<i>{italic}</i>'
+            return '<br>'
+
+        return _FMT_RE.sub(_render, text)
     
     def add_message(self, text, is_user=True):
         """Add a message"""
+        self._history.append((text, is_user))
+
         message_widget = QWidget()
         layout = QHBoxLayout(message_widget)
         layout.setContentsMargins(10, 5, 10, 5)
@@ -121,11 +255,7 @@ class ChatWidget(QWidget):
         # Create avatar
         avatar = QLabel()
         avatar.setFixedSize(40, 40)
-        avatar_path = os.path.join("resources", "user_avatar.png" if is_user else "ai_avatar.png")
-        pixmap = QPixmap(avatar_path)
-        if pixmap.isNull():
-            print(f"Warning: Could not load avatar image from {avatar_path}")
-        avatar.setPixmap(pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        avatar.setPixmap(self._user_avatar if is_user else self._ai_avatar)
         
         # Create bubble
         bubble = QFrame()
@@ -143,26 +273,18 @@ class ChatWidget(QWidget):
         # Set rich text content
         formatted_text = self.format_text(text, is_user)
         message.setHtml(formatted_text)
-        
-        # Adjust text browser size
-        message.document().adjustSize()
-        content_height = message.document().size().height()
-        message.setFixedHeight(content_height + 10)  # ����һЩ�߾�
+
+        # Fix the wrap width up front so the document lays out exactly once;
+        # adjustSize laid the text out unconstrained and a second layout ran
+        # when the widget was later resized to the real width
+        doc = message.document()
+        doc.setTextWidth(self.ui.scrollArea.viewport().width() - self._MESSAGE_CHROME_WIDTH)
+        content_height = doc.documentLayout().documentSize().height()
+        message.setFixedHeight(int(content_height) + 10)  # ����һЩ�߾�
         
         # Set styles
-        bubble.setStyleSheet(f"""
-            QFrame {{
-                background-color: {'#007AFF' if is_user else '#E9E9EB'};
-                border-radius: 15px;
-            }}
-        """)
-        message.setStyleSheet(f"""
-            QTextBrowser {{
-                background: transparent;
-                border: none;
-                color: {'white' if is_user else 'black'};
-            }}
-        """)
+        bubble.setStyleSheet(self._USER_BUBBLE_QSS if is_user else self._AI_BUBBLE_QSS)
+        message.setStyleSheet(self._USER_MESSAGE_QSS if is_user else self._AI_MESSAGE_QSS)
         
         # Layout arrangement
         if is_user:
@@ -174,19 +296,26 @@ class ChatWidget(QWidget):
             layout.addWidget(bubble)
             bubble_layout.addWidget(message)
         
-        # Add to message list
-        self.ui.messageLayout.insertWidget(
-            self.ui.messageLayout.count() - 1,
-            message_widget
-        )
-        
-        # Scroll to bottom
-        self.ui.scrollArea.verticalScrollBar().setValue(
-            self.ui.scrollArea.verticalScrollBar().maximum()
-        )
+        # Add to message list; the rangeChanged hook set up in __init__
+        # scrolls to the bottom once the new widget has been laid out
+        self.ui.messageLayout.addWidget(message_widget)
+
+        # Dematerialize the oldest bubbles once the live window is full;
+        # each bubble carries a QTextDocument, so an unbounded transcript
+        # otherwise grows layout and memory cost for the life of the session
+        while self.ui.messageLayout.count() > self._MAX_LIVE_MESSAGES:
+            item = self.ui.messageLayout.takeAt(0)
+            old_widget = item.widget()
+            if old_widget is not None:
+                old_widget.deleteLater()
+
+        return message
 
     def on_send_clicked(self):
         """Send button click event"""
+        # Cheap emptiness check before serializing the document to a string
+        if self.ui.messageInput.document().isEmpty():
+            return
         text = self.ui.messageInput.toPlainText().strip()
         if text:
             # Show user message
@@ -196,12 +325,54 @@ class ChatWidget(QWidget):
             # Disable send button
             self.ui.sendButton.setEnabled(False)
             
-            # Create and start AI response thread
-            self.ai_thread = AIThread(self.agent, text)
-            self.ai_thread.reply_ready.connect(self.handle_ai_reply)
-            self.ai_thread.error_occurred.connect(self.handle_error)
-            self.ai_thread.finished.connect(lambda: self.ui.sendButton.setEnabled(True))
-            self.ai_thread.start()
+            # Answer repeats from the cache without touching the agent
+            cached = self._reply_cache.get(text)
+            if cached is not None:
+                self._reply_cache.move_to_end(text)
+                self.add_message(cached, False)
+                self.ui.sendButton.setEnabled(True)
+                return
+
+            # Hand the AI call to the shared pool; the runnable is
+            # auto-deleted by the pool once run() returns
+            job = AIJob(self.agent, text)
+            job.signals.chunk_ready.connect(self._handle_ai_chunk)
+            job.signals.reply_ready.connect(
+                lambda reply, prompt=text: self._handle_ai_reply(prompt, reply)
+            )
+            job.signals.error_occurred.connect(self.handle_error)
+            job.signals.finished.connect(lambda: self.ui.sendButton.setEnabled(True))
+            self._pool.start(job)
+
+    def _handle_ai_chunk(self, chunk):
+        """Grow the current AI bubble as response pieces arrive"""
+        self._stream_parts.append(chunk)
+        text = ''.join(self._stream_parts)
+        if self._stream_browser is None:
+            self._stream_browser = self.add_message(text, False)
+            return
+
+        browser = self._stream_browser
+        browser.setHtml(self.format_text(text, False))
+        doc = browser.document()
+        doc.setTextWidth(self.ui.scrollArea.viewport().width() - self._MESSAGE_CHROME_WIDTH)
+        browser.setFixedHeight(int(doc.documentLayout().documentSize().height()) + 10)
+
+    def _handle_ai_reply(self, prompt, reply):
+        """Cache the completed reply and close out the streamed bubble"""
+        self._reply_cache[prompt] = reply
+        if len(self._reply_cache) > self._reply_cache_size:
+            self._reply_cache.popitem(last=False)
+
+        if self._stream_browser is None:
+            # Nothing streamed (error path fallback): show it whole
+            self.handle_ai_reply(reply)
+        else:
+            # The history record was made from the first chunk; settle it
+            # to the complete reply
+            self._history[-1] = (reply, False)
+        self._stream_parts = []
+        self._stream_browser = None
 
     def handle_ai_reply(self, reply):
         """Handle AI response"""
@@ -209,13 +380,18 @@ class ChatWidget(QWidget):
 
     def handle_error(self, error_message):
         """Handle error"""
+        # A failure mid-stream leaves a partial bubble behind; abandon it
+        self._stream_parts = []
+        self._stream_browser = None
         self.add_message(error_message, False)
     
     def adjust_input_height(self):
         """Adjust input box height"""
         doc_height = self.ui.messageInput.document().size().height()
-        new_height = min(max(50, doc_height + 10), 200)
-        self.ui.messageInput.setFixedHeight(int(new_height))
+        new_height = int(min(max(50, doc_height + 10), 200))
+        # Typing within the current height band shouldn't trigger a relayout
+        if new_height != self.ui.messageInput.height():
+            self.ui.messageInput.setFixedHeight(new_height)
 
 
 if __name__ == "__main__":
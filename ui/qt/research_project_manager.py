@@ -3,13 +3,32 @@ from PySide6.QtWidgets import QMenu, QMessageBox, QInputDialog
 from gscientist.project_manager import ProjectManager
 import os
 
+# Display order of the default folders; unknown names sort last
+FOLDER_ORDER = {
+    "Literature Review": 0,
+    "Proposal": 1,
+    "Experiment": 2,
+    "Manuscript": 3
+}
+_DEFAULT_ORDER = len(FOLDER_ORDER)
+
+
 class TreeItem:
     def __init__(self, data, parent=None):
         self.parent_item = parent
         self.item_data = data
+        # Display string resolved once; data() hands it straight to Qt
+        # instead of a dict lookup per paint
+        self.display = data.get("name") if isinstance(data, dict) else str(data)
         self.child_items = []
+        # Lazily populated nodes flip this to False until fetchMore runs
+        self.children_loaded = True
+        # Position among siblings, maintained by appendChild and removals;
+        # Qt asks for it constantly while painting
+        self._row = 0
 
     def appendChild(self, item):
+        item._row = len(self.child_items)
         self.child_items.append(item)
 
     def child(self, row):
@@ -28,62 +47,87 @@ class TreeItem:
         return self.parent_item
 
     def row(self):
-        if self.parent_item:
-            return self.parent_item.child_items.index(self)
-        return 0
+        return self._row
 
 class ResearchProjectModel(QAbstractItemModel):
-    # Define folder order
-    FOLDER_ORDER = {
-        "Literature Review": 0,
-        "Proposal": 1,
-        "Experiment": 2,
-        "Manuscript": 3
-    }
-
     def __init__(self, base_path=None):
         super().__init__()
         self.project_manager = ProjectManager(base_path)
         self.root_item = TreeItem({"name": "Projects"})
+        # Project rows by id so mutations don't scan the root's children
+        self._project_index = {}
         self.setupModelData()
 
-    def _get_folder_sort_order(self, folder_name):
-        return self.FOLDER_ORDER.get(folder_name, len(self.FOLDER_ORDER))
-
     def setupModelData(self):
         self.projects = self.project_manager.list_projects()
         if not self.projects:
             project = self.create_new_project("Default Research Project")
             self.projects = [project]
+            return
 
+        # Only project rows are built up front; each project's folders are
+        # loaded by fetchMore the first time the user expands it
         for project in self.projects:
+            # Canonical type tag; the view classifies clicks with it instead
+            # of probing for id/parent_id keys
+            project["_type"] = "project"
             project_item = TreeItem(project, self.root_item)
+            project_item.children_loaded = False
             self.root_item.appendChild(project_item)
-            
-            # Load folders for this project
-            folders = self.project_manager.get_project_structure(project["id"])
-            
-            # Sort folders based on predefined order
-            folders.sort(key=lambda x: self._get_folder_sort_order(x["name"]))
-            
-            folder_items = {}
-            
-            # First pass: create all folder items
-            for folder in folders:
-                folder_item = TreeItem(folder, project_item if folder["parent_id"] is None else folder_items[folder["parent_id"]])
-                folder_items[folder["id"]] = folder_item
-                
-                if folder["parent_id"] is None:
-                    project_item.appendChild(folder_item)
-                else:
-                    parent_item = folder_items[folder["parent_id"]]
-                    # Find the correct position to insert based on sort order
-                    insert_pos = 0
-                    for i, child in enumerate(parent_item.child_items):
-                        if self._get_folder_sort_order(child.data()["name"]) > self._get_folder_sort_order(folder["name"]):
-                            break
-                        insert_pos = i + 1
-                    parent_item.child_items.insert(insert_pos, folder_item)
+            self._project_index[project["id"]] = project_item
+
+    def hasChildren(self, parent=QModelIndex()):
+        # Unloaded projects must still show an expander before their
+        # folder rows exist
+        if parent.isValid() and not parent.internalPointer().children_loaded:
+            return True
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        return not parent.internalPointer().children_loaded
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            return
+        project_item = parent.internalPointer()
+        if project_item.children_loaded:
+            return
+        project_item.children_loaded = True
+
+        folders = self.project_manager.get_project_structure(project_item.data()["id"])
+        if not folders:
+            return
+
+        # Sort once so plain appendChild preserves the display order: ids
+        # ascend in creation order, so ordering by parent id puts every
+        # parent's rows before its children's and groups siblings, and the
+        # predefined order then ranks siblings. The order values are
+        # computed once per folder instead of per comparison (and per
+        # sibling in the old insert-position scan, which was quadratic).
+        order = {f["id"]: FOLDER_ORDER.get(f["name"], _DEFAULT_ORDER) for f in folders}
+        folders.sort(key=lambda f: (f["parent_id"] or 0, order[f["id"]]))
+
+        # Build the whole subtree detached, then insert the root folders
+        # under the project in one begin/endInsertRows batch
+        folder_items = {}
+        root_folders = []
+        for folder in folders:
+            folder["_type"] = "folder"
+            if folder["parent_id"] is None:
+                folder_item = TreeItem(folder, project_item)
+                root_folders.append(folder_item)
+            else:
+                parent_item = folder_items[folder["parent_id"]]
+                folder_item = TreeItem(folder, parent_item)
+                parent_item.appendChild(folder_item)
+            folder_items[folder["id"]] = folder_item
+
+        self.beginInsertRows(parent, 0, len(root_folders) - 1)
+        for folder_item in root_folders:
+            project_item.appendChild(folder_item)
+        self.endInsertRows()
 
     def index(self, row, column, parent=QModelIndex()):
         if not self.hasIndex(row, column, parent):
@@ -129,10 +173,8 @@ class ResearchProjectModel(QAbstractItemModel):
         if not index.isValid():
             return None
 
-        item = index.internalPointer()
-        
         if role == Qt.DisplayRole:
-            return item.data()["name"]
+            return index.internalPointer().display
 
         return None
 
@@ -146,32 +188,41 @@ class ResearchProjectModel(QAbstractItemModel):
         """Create a new research project."""
         project_id = self.project_manager.create_project(project_name)
         project = self.project_manager.get_project(project_id)
+        project["_type"] = "project"
         project_item = TreeItem(project, self.root_item)
+        # The default folders already exist in the database; defer building
+        # their rows to fetchMore so the insert is one batched row here and
+        # one batched subtree on first expand
+        project_item.children_loaded = False
         self.beginInsertRows(QModelIndex(), self.root_item.childCount(), self.root_item.childCount())
         self.root_item.appendChild(project_item)
         self.endInsertRows()
+        self._project_index[project["id"]] = project_item
         return project
 
     def rename_project(self, project_id, new_name):
         """Rename an existing project."""
         self.project_manager.rename_project(project_id, new_name)
-        # Update the local project list
-        for i in range(self.root_item.childCount()):
-            project_item = self.root_item.child(i)
-            if project_item.data()["id"] == project_id:
-                project_item.item_data["name"] = new_name
-                self.dataChanged.emit(self.index(i, 0, QModelIndex()), self.index(i, 0, QModelIndex()))
-                break
+        project_item = self._project_index.get(project_id)
+        if project_item is None:
+            return
+        project_item.item_data["name"] = new_name
+        project_item.display = new_name
+        row = project_item.row()
+        index = self.index(row, 0, QModelIndex())
+        self.dataChanged.emit(index, index)
 
     def delete_project(self, project_id):
         """Delete a research project."""
-        for i in range(self.root_item.childCount()):
-            project_item = self.root_item.child(i)
-            if project_item.data()["id"] == project_id:
-                self.beginRemoveRows(QModelIndex(), i, i)
-                self.root_item.child_items.pop(i)
-                self.endRemoveRows()
-                break
+        project_item = self._project_index.pop(project_id, None)
+        if project_item is not None:
+            row = project_item.row()
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.root_item.child_items.pop(row)
+            # Re-index the siblings shifted down by the removal
+            for j in range(row, len(self.root_item.child_items)):
+                self.root_item.child_items[j]._row = j
+            self.endRemoveRows()
         self.project_manager.delete_project(project_id)
 
     def list_projects(self):
@@ -184,6 +235,11 @@ class ResearchTreeView:
         self.model = ResearchProjectModel(base_path)
         self.tree_view.setModel(self.model)
 
+        # All rows are one-line labels, so let Qt measure a single height
+        # instead of sizing every visible row; skip expand animations too
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setAnimated(False)
+
         # Setup context menu
         self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
@@ -191,6 +247,31 @@ class ResearchTreeView:
         # Setup double click for rename
         self.tree_view.doubleClicked.connect(self.handle_double_click)
 
+    def _iter_indexes(self, parent=QModelIndex()):
+        """Yield every index in the model, depth first."""
+        for row in range(self.model.rowCount(parent)):
+            index = self.model.index(row, 0, parent)
+            yield index
+            yield from self._iter_indexes(index)
+
+    def apply_expansion(self, keep_expanded):
+        """Restore an expansion state in bulk.
+
+        Callers restoring state must not loop expand(index) per row: each
+        call invalidates the view layout. expandAll followed by targeted
+        collapses performs one bulk pass instead. keep_expanded is a set of
+        indexes that should stay expanded. Note that expandAll materializes
+        lazily loaded projects, as any full state restore must.
+        """
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self.tree_view.expandAll()
+            for index in self._iter_indexes():
+                if index not in keep_expanded and self.model.hasChildren(index):
+                    self.tree_view.collapse(index)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+
     def show_context_menu(self, position):
         index = self.tree_view.indexAt(position)
 
@@ -209,8 +290,8 @@ class ResearchTreeView:
         # Create menu based on item type
         menu = QMenu()
         
-        # Check if this is a project (has 'id' in item data) or a folder
-        if 'id' in item and 'parent_id' not in item:
+        # Items carry their canonical "_type" tag from the model
+        if item.get("_type") == "project":
             # This is a project item
             new_project_action = menu.addAction("New Research Project")
             rename_action = menu.addAction("Rename Project")
@@ -233,9 +314,13 @@ class ResearchTreeView:
             action = menu.exec_(self.tree_view.viewport().mapToGlobal(position))
             
             if action and action.text() == "View in Explorer":
-                path = item.get('path', '')
-                if path and os.path.exists(path):
-                    os.startfile(path)
+                # EAFP: let startfile report a missing path instead of
+                # paying a stat() on every click just to pre-check it
+                if path := item.get('path'):
+                    try:
+                        os.startfile(path)
+                    except OSError:
+                        pass
 
     def create_new_project(self):
         """Prompt the user to create a new research project."""
@@ -281,11 +366,13 @@ class ResearchTreeView:
             return
             
         item = index.internalPointer().data()
-        if 'id' in item and 'parent_id' not in item:
+        if item.get("_type") == "project":
             # This is a project item
             self.rename_project(item)
         else:
             # This is a folder item
-            path = item.get('path', '')
-            if path and os.path.exists(path):
-                os.startfile(path)
\ No newline at end of file
+            if path := item.get('path'):
+                try:
+                    os.startfile(path)
+                except OSError:
+                    pass
\ No newline at end of file